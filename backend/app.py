@@ -1,11 +1,12 @@
 from fastapi import FastAPI, UploadFile, File, HTTPException
 from fastapi.responses import StreamingResponse, JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
 import os
+import shutil
 import tempfile
-import csv
 import io
-from typing import List, Optional
+from typing import List
 from pydantic import BaseModel
 
 from services.epub_processor import extract_chapters_from_epub, get_vocab_with_context
@@ -49,21 +50,22 @@ async def upload_epub(file: UploadFile = File(...), limit: int = 2000):
         raise HTTPException(
             status_code=400, detail="File must be an EPUB file")
 
-    # Save uploaded file temporarily
+    # Save uploaded file temporarily, copying in chunks off the event loop
     with tempfile.NamedTemporaryFile(delete=False, suffix='.epub') as tmp_file:
-        content = await file.read()
-        tmp_file.write(content)
+        await run_in_threadpool(
+            shutil.copyfileobj, file.file, tmp_file, 1 << 20)
         tmp_path = tmp_file.name
 
     try:
-        # Extract chapters
-        chapters = extract_chapters_from_epub(tmp_path)
+        # Extract chapters (EPUB parsing is blocking, so run it in a thread)
+        chapters = await run_in_threadpool(extract_chapters_from_epub, tmp_path)
 
         # Load known words from SQLite database
         known_words = load_known_words()
 
         # Analyze text
-        top_vocab = get_vocab_with_context(chapters, known_words, limit=limit)
+        top_vocab = await run_in_threadpool(
+            get_vocab_with_context, chapters, known_words, limit=limit)
 
         # Convert to dict format for JSON response
         vocab_list = [
@@ -175,7 +177,7 @@ async def generate_anki():
 
     try:
         # Create Anki deck from database cache
-        apkg_bytes = create_anki_deck_bytes(vocab_list)
+        apkg_bytes = await run_in_threadpool(create_anki_deck_bytes, vocab_list)
 
         return StreamingResponse(
             io.BytesIO(apkg_bytes),
@@ -207,7 +209,7 @@ async def generate_anki_known():
     ]
 
     try:
-        apkg_bytes = create_anki_deck_bytes(vocab_list)
+        apkg_bytes = await run_in_threadpool(create_anki_deck_bytes, vocab_list)
 
         return StreamingResponse(
             io.BytesIO(apkg_bytes),
@@ -1,5 +1,7 @@
 import uvicorn
 
 if __name__ == "__main__":
+    # The default loop/http "auto" settings pick uvloop and httptools when
+    # they are installed (see requirements.txt) and fall back to asyncio/h11
     uvicorn.run("app:app", host="0.0.0.0", port=8000, reload=True)
 
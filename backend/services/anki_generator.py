@@ -1,11 +1,18 @@
 import genanki
-import tempfile
-import os
+import io
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from jamdict import Jamdict
 from typing import List, Dict
 
-# Initialize Dictionary
-jam = Jamdict()
+# Dictionary lookups run on a small persistent pool; each worker thread keeps
+# its own Jamdict since its SQLite connection can't be shared across threads
+_jam_local = threading.local()
+LOOKUP_POOL = ThreadPoolExecutor(max_workers=8)
+
+HAS_KANJI = re.compile(r'[\u4e00-\u9fff]').search
 
 # Define the Anki Note Model
 MY_MODEL = genanki.Model(
@@ -34,9 +41,18 @@ MY_MODEL = genanki.Model(
 )
 
 
+def _get_jamdict():
+    """Return this thread's Jamdict instance, creating it on first use."""
+    jam = getattr(_jam_local, 'jam', None)
+    if jam is None:
+        jam = _jam_local.jam = Jamdict()
+    return jam
+
+
+@lru_cache(maxsize=10000)
 def get_definition(word):
     """Fetch the first English definition from JMdict."""
-    result = jam.lookup(word)
+    result = _get_jamdict().lookup(word)
     if result.entries:
         # Get the first sense of the first entry
         definitions = result.entries[0].senses[0].gloss
@@ -51,42 +67,34 @@ def create_anki_deck_bytes(vocab_list: List[Dict[str, any]]) -> bytes:
     """
     my_deck = genanki.Deck(2059400110, 'Japanese Vocabulary')
 
+    notes = []
     for item in vocab_list:
         word = item['word']
         frequency = str(item['frequency'])
         context = item['context']
 
         # 1. Skip if Context is messy (like the TOC you found)
-        if "Navigation" in context or len(context) > 300:
+        if len(context) > 300 or "Navigation" in context:
             continue
 
         # 2. Skip non-Kanji filler words (san, nai, etc.)
         # This checks if the word contains at least one Kanji
-        if not any('\u4e00' <= char <= '\u9fff' for char in word):
+        if not HAS_KANJI(word):
             continue
 
-        # 3. Lookup Meaning
-        meaning = get_definition(word)
+        notes.append((word, frequency, context))
+
+    # 3. Lookup Meanings concurrently (sqlite releases the GIL while querying)
+    meanings = LOOKUP_POOL.map(get_definition, [word for word, _, _ in notes])
 
+    for (word, frequency, context), meaning in zip(notes, meanings):
         note = genanki.Note(
             model=MY_MODEL,
             fields=[word, frequency, context, meaning]
         )
         my_deck.add_note(note)
 
-    # Write to temporary file, then read as bytes
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.apkg') as tmp_file:
-        tmp_path = tmp_file.name
-
-    try:
-        package = genanki.Package(my_deck)
-        package.write_to_file(tmp_path)
-
-        with open(tmp_path, 'rb') as f:
-            apkg_bytes = f.read()
-
-        return apkg_bytes
-    finally:
-        # Clean up temp file
-        if os.path.exists(tmp_path):
-            os.unlink(tmp_path)
+    # genanki zips straight into any file-like object, so skip the tempfile
+    buffer = io.BytesIO()
+    genanki.Package(my_deck).write_to_file(buffer)
+    return buffer.getvalue()
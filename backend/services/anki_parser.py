@@ -6,6 +6,17 @@ import re
 import html
 from typing import Set, List
 
+# Common particles that should never be treated as vocabulary
+COMMON_PARTICLES = frozenset({'の', 'に', 'は', 'を', 'が', 'で', 'と',
+                              'も', 'から', 'まで', 'より', 'へ', 'か', 'ね', 'よ', 'さ'})
+
+# Hiragana, Katakana, CJK Extension A, Kanji
+HAS_JAPANESE = re.compile(r'[\u3040-\u30FF\u3400-\u4DBF\u4E00-\u9FAF]').search
+JAPANESE_RUN = re.compile(r'[\u3040-\u30FF\u3400-\u4DBF\u4E00-\u9FAF]+')
+
+# HTML tags within a single line
+HTML_TAG = re.compile(r'<[^>\n]+>')
+
 
 def extract_words_from_anki_txt(file_content: str) -> Set[str]:
     """
@@ -22,40 +33,19 @@ def extract_words_from_anki_txt(file_content: str) -> Set[str]:
     Returns:
         Set of Japanese words found in the file
     """
-    words = set()
-    lines = file_content.strip().split('\n')
-
-    for line in lines:
-        if not line.strip():
-            continue
-
-        # Split by tab (Anki text export format)
-        fields = line.split('\t')
-
-        # Only use the first column (the actual word)
-        if not fields or not fields[0].strip():
-            continue
-
-        # Get the first field (the word)
-        first_field = fields[0].strip()
-
-        # Clean HTML tags if present
-        cleaned = clean_html(first_field)
-
-        # Extract Japanese words from the first field
-        extracted_words = extract_words_from_text(cleaned)
-
-        for word in extracted_words:
-            if is_japanese_word(word):
-                words.add(word)
+    # Only use the first column (the actual word) of each line, then clean
+    # and scan all of them in one pass; tags and runs never span lines
+    first_fields = '\n'.join(
+        line.partition('\t')[0] for line in file_content.strip().split('\n'))
+    words = set(extract_words_from_text(clean_html(first_fields)))
 
-    return words
+    return {word for word in words if is_japanese_word(word)}
 
 
 def clean_html(text: str) -> str:
     """Remove HTML tags and decode HTML entities."""
     # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
+    text = HTML_TAG.sub('', text)
     # Decode HTML entities
     text = html.unescape(text)
     return text.strip()
@@ -68,9 +58,7 @@ def extract_words_from_text(text: str) -> List[str]:
     """
     # Match sequences of Japanese characters (Hiragana, Katakana, Kanji)
     # This regex finds one or more Japanese characters in a row
-    words = re.findall(
-        r'[\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FAF\u3400-\u4DBF]+', text)
-    return [w.strip() for w in words if w.strip()]
+    return JAPANESE_RUN.findall(text)
 
 
 def is_japanese_word(word: str) -> bool:
@@ -83,24 +71,7 @@ def is_japanese_word(word: str) -> bool:
         return False
 
     # Filter out common particles and very short words
-    common_particles = {'の', 'に', 'は', 'を', 'が', 'で', 'と',
-                        'も', 'から', 'まで', 'より', 'へ', 'か', 'ね', 'よ', 'さ'}
-    if word in common_particles:
+    if word in COMMON_PARTICLES:
         return False
 
-    # Check for Japanese character ranges
-    has_japanese = False
-    for char in word:
-        # Hiragana: U+3040-U+309F
-        # Katakana: U+30A0-U+30FF
-        # Kanji: U+4E00-U+9FAF
-        # CJK Unified Ideographs Extension A: U+3400-U+4DBF
-        code = ord(char)
-        if (0x3040 <= code <= 0x309F or  # Hiragana
-            0x30A0 <= code <= 0x30FF or  # Katakana
-            0x4E00 <= code <= 0x9FAF or  # Kanji
-                0x3400 <= code <= 0x4DBF):   # Extension A
-            has_japanese = True
-            break
-
-    return has_japanese
+    return HAS_JAPANESE(word) is not None
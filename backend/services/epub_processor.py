@@ -1,15 +1,33 @@
-import os
-import re
 import ebooklib
 from ebooklib import epub
-from janome.tokenizer import Tokenizer
+import fugashi
+import ipadic
 import lxml.html
-import hashlib
+from lxml import etree
+import xxhash
+import multiprocessing
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 
 # Initialize constants
-TOKENIZER = Tokenizer()
-BLACKList = {'いる', 'する', 'ある', 'なる', 'れる', 'られる', 'いう',
-             'もの', 'こと', 'とき', 'そう', 'よう', 'くる', 'いく'}
+# MeCab with IPADic yields the same POS tags and base forms Janome did,
+# except that words missing from IPADic get '*' as their base form where
+# Janome used the surface; the tally loop falls back to the surface.
+# SudachiPy benchmarks at roughly MeCab speed and Vaporetto drops the POS
+# tags the filter below relies on, so neither is worth the swap.
+TAGGER = fugashi.GenericTagger(ipadic.MECAB_ARGS)
+BLACKList = frozenset({'いる', 'する', 'ある', 'なる', 'れる', 'られる', 'いう',
+                       'もの', 'こと', 'とき', 'そう', 'よう', 'くる', 'いく'})
+ALLOWED_POS = frozenset({'名詞', '動詞', '形容詞'})
+# Appends a record separator after each sentence terminator so a plain
+# str.split can break sentences while keeping the punctuation
+SENTENCE_END_TABLE = str.maketrans(
+    {char: char + '\x1e' for char in '。！？」'})
+
+# Tokenizer worker pool, created lazily and reused across uploads
+_POOL = None
+_POOL_LOCK = threading.Lock()
 
 
 def extract_chapters_from_epub(epub_path):
@@ -25,16 +43,16 @@ def extract_chapters_from_epub(epub_path):
             continue
         tree = lxml.html.fromstring(content)
 
-        # Find all <rt> tags (the small hiragana above kanji) and remove them
-        for rt in tree.xpath('.//rt'):
-            rt.getparent().remove(rt)
+        # Strip all <rt> tags (the small hiragana above kanji) in one pass,
+        # keeping their tail text (the next kanji inside the <ruby>)
+        etree.strip_elements(tree, 'rt', with_tail=False)
 
         text = tree.text_content().strip()
         if not text:
             continue
 
         # Create a unique fingerprint for this text block
-        text_hash = hashlib.md5(text.encode('utf-8')).hexdigest()
+        text_hash = xxhash.xxh3_64_intdigest(text.encode('utf-8'))
 
         if text_hash in seen_hashes:
             # We've seen this exact content before (e.g. a duplicate file)
@@ -45,53 +63,77 @@ def extract_chapters_from_epub(epub_path):
     return chapters
 
 
-def load_known_words(file_path):
-    """Loads known words from an Anki export txt file into a set."""
-    known_words = set()
-    if not os.path.exists(file_path):
-        return known_words
+def _analyze_chapter(text):
+    """Counts words in a single chapter. Runs inside a worker process."""
+    counts = Counter()
+    first_sentence = {}
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            parts = line.split('\t')
-            if parts:
-                word = parts[0].strip()
-                known_words.add(word)
-    return known_words
+    # Split into sentences using Japanese punctuation, including closing quotes
+    sentences = text.translate(SENTENCE_END_TABLE).split('\x1e')
 
+    for sentence in sentences:
+        sentence = sentence.strip()
+        if len(sentence) < 5:  # Skip tiny fragments
+            continue
 
-def get_vocab_with_context(chapters, known_words, limit=2000):
-    """Processes text to find frequencies and a sample sentence for each word."""
-    word_info = {}  # Format: { "word": [count, "example sentence"] }
+        words = []
+        # Read MeCab's raw "surface\tfeatures" lines directly instead of
+        # wrapping every token in a Node object and feature tuple
+        for line in TAGGER.parse(sentence).split('\n'):
+            # IPADic features: POS levels 0-3, ..., base form at index 6
+            surface, _, rest = line.partition('\t')
+            feature = rest.split(',')
+            if len(feature) < 7:  # EOS marker or blank line
+                continue
+            base = feature[6]
+            if base == '*':  # Unknown to IPADic (names, new loanwords)
+                base = surface
+
+            # Filters
+            if len(base) <= 1 or base in BLACKList:
+                continue
+
+            # Keep only independent Nouns, Verbs, Adjectives
+            if feature[0] not in ALLOWED_POS or '非自立' in feature[1]:
+                continue
 
-    for text in chapters:
-        # Split into sentences using Japanese punctuation, including closing quotes
-        sentences = re.split(r'(?<=[。！？」])', text)
+            words.append(base)
 
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if len(sentence) < 5:  # Skip tiny fragments
+        counts.update(words)
+        for base in words:
+            first_sentence.setdefault(base, sentence)
+
+    return counts, first_sentence
+
+
+def _get_pool():
+    """Return the shared tokenizer pool, starting it on first use."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            # spawn rather than fork: callers run on server worker threads
+            _POOL = ProcessPoolExecutor(
+                mp_context=multiprocessing.get_context('spawn'))
+        return _POOL
+
+
+def get_vocab_with_context(chapters, known_words, limit=2000):
+    """Processes text to find frequencies and a sample sentence for each word."""
+    counts = Counter()
+    first_sentence = {}
+
+    # Chapters are independent, so tokenize them in parallel and merge.
+    # map() yields in chapter order, so the first sentence seen is kept.
+    # Known words are dropped here rather than shipped to every task.
+    for chapter_counts, chapter_sentences in _get_pool().map(
+            _analyze_chapter, chapters):
+        for base, count in chapter_counts.items():
+            if base in known_words:
                 continue
+            counts[base] += count
+            first_sentence.setdefault(base, chapter_sentences[base])
 
-            tokens = TOKENIZER.tokenize(sentence)
-            for t in tokens:
-                base = t.base_form
-                pos = t.part_of_speech
-
-                # Filters
-                if len(base) <= 1:
-                    continue
-                if base in BLACKList or base in known_words:
-                    continue
-
-                # Keep only independent Nouns, Verbs, Adjectives
-                if pos.startswith(('名詞', '動詞', '形容詞')) and '非自立' not in pos:
-                    if base not in word_info:
-                        word_info[base] = [1, sentence]
-                    else:
-                        word_info[base][0] += 1
-
-    # Sort by frequency and return top N
-    sorted_vocab = sorted(
-        word_info.items(), key=lambda x: x[1][0], reverse=True)
-    return sorted_vocab[:limit]
+    # Return top N by frequency as [(word, [count, "example sentence"]), ...]
+    # most_common(n) selects via heapq.nlargest: O(n log k), no full sort
+    return [(base, [count, first_sentence[base]])
+            for base, count in counts.most_common(limit)]
@@ -4,14 +4,17 @@ No external database server required - uses local file.
 """
 import sqlite3
 from pathlib import Path
-from typing import Set, List, Dict, Any
-from threading import Lock
+from typing import Set, FrozenSet, List, Dict, Any
+from threading import Lock, local
 from contextlib import contextmanager
+from functools import lru_cache
 
 STORAGE_DIR = Path(__file__).parent.parent / "data"
 DB_FILE = STORAGE_DIR / "vocab.db"
 
 _db_lock = Lock()
+_write_conn = None
+_read_local = local()
 
 
 def ensure_storage_dir():
@@ -19,21 +22,47 @@ def ensure_storage_dir():
     STORAGE_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def _connect() -> sqlite3.Connection:
+    """Open a tuned autocommit connection; transactions are explicit."""
+    ensure_storage_dir()
+    conn = sqlite3.connect(
+        DB_FILE, check_same_thread=False, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    # page_size only takes effect on a new database, before WAL is enabled
+    conn.execute("PRAGMA page_size=4096")
+    # WAL + NORMAL avoids an fsync of a rollback journal on every commit
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")
+    conn.execute("PRAGMA mmap_size=268435456")
+    return conn
+
+
 @contextmanager
 def get_db_connection():
-    """Get a database connection with proper locking."""
-    ensure_storage_dir()
+    """Get the shared write connection inside a locked transaction."""
+    global _write_conn
     with _db_lock:
-        conn = sqlite3.connect(DB_FILE, check_same_thread=False)
-        conn.row_factory = sqlite3.Row
+        if _write_conn is None:
+            _write_conn = _connect()
+        conn = _write_conn
+        conn.execute("BEGIN IMMEDIATE")
         try:
             yield conn
-            conn.commit()
+            conn.execute("COMMIT")
         except Exception:
-            conn.rollback()
+            conn.execute("ROLLBACK")
             raise
-        finally:
-            conn.close()
+
+
+@contextmanager
+def get_read_connection():
+    """Get this thread's read connection (WAL readers don't need the lock)."""
+    conn = getattr(_read_local, 'conn', None)
+    if conn is None:
+        conn = _read_local.conn = _connect()
+    yield conn
 
 
 def init_database():
@@ -61,17 +90,21 @@ def init_database():
         """)
 
 
+@lru_cache(maxsize=1)
+def _load_known_words_cached() -> FrozenSet[str]:
+    """Read known words from the database; cleared on every write."""
+    with get_read_connection() as conn:
+        cursor = conn.execute("SELECT word FROM known_words")
+        return frozenset(row['word'] for row in cursor.fetchall())
+
+
 def load_known_words() -> Set[str]:
     """Load known words from database."""
-    init_database()
-    with get_db_connection() as conn:
-        cursor = conn.execute("SELECT word FROM known_words")
-        return {row['word'] for row in cursor.fetchall()}
+    return set(_load_known_words_cached())
 
 
 def save_known_words(words: Set[str]):
     """Save known words to database."""
-    init_database()
     with get_db_connection() as conn:
         # Clear existing and insert new
         conn.execute("DELETE FROM known_words")
@@ -79,39 +112,39 @@ def save_known_words(words: Set[str]):
             "INSERT INTO known_words (word) VALUES (?)",
             [(word,) for word in words]
         )
+    _load_known_words_cached.cache_clear()
 
 
 def add_known_words(words: Set[str]):
     """Add words to known words (without clearing existing)."""
-    init_database()
     with get_db_connection() as conn:
         conn.executemany(
             "INSERT OR IGNORE INTO known_words (word) VALUES (?)",
             [(word,) for word in words]
         )
+    _load_known_words_cached.cache_clear()
 
 
 def remove_known_words(words: Set[str]):
     """Remove words from known words."""
-    init_database()
     with get_db_connection() as conn:
         conn.executemany(
             "DELETE FROM known_words WHERE word = ?",
             [(word,) for word in words]
         )
+    _load_known_words_cached.cache_clear()
 
 
 def clear_all_known_words():
     """Clear all known words from the database."""
-    init_database()
     with get_db_connection() as conn:
         conn.execute("DELETE FROM known_words")
+    _load_known_words_cached.cache_clear()
 
 
 def load_vocab_cache() -> List[Dict[str, Any]]:
     """Load vocabulary cache from database."""
-    init_database()
-    with get_db_connection() as conn:
+    with get_read_connection() as conn:
         cursor = conn.execute("""
             SELECT word, frequency, context 
             FROM vocab_cache 
@@ -129,7 +162,6 @@ def load_vocab_cache() -> List[Dict[str, Any]]:
 
 def save_vocab_cache(vocab_list: List[Dict[str, Any]]):
     """Save vocabulary cache to database."""
-    init_database()
     with get_db_connection() as conn:
         # Clear old cache
         conn.execute("DELETE FROM vocab_cache")
@@ -139,3 +171,7 @@ def save_vocab_cache(vocab_list: List[Dict[str, Any]]):
             [(item['word'], item['frequency'], item['context'])
              for item in vocab_list]
         )
+
+
+# Create tables once at import rather than on every call
+init_database()